@@ -14,21 +14,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Collection, Sequence
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from itertools import chain
 import logging
+from operator import attrgetter
+from typing import Any
 
-from .architecture_exporter import ArchitectureExporter
 from .architecture_loaded import ArchitectureLoaded, NodeValuesLoaded
 from .architecture_reader_factory import ArchitectureReaderFactory
-from .combine_path import CombinePath
 from .graph_search import NodePathSearcher
 
 from .reader_interface import ArchitectureReader, IGNORE_TOPICS
 from .struct import (CallbackStruct, CommunicationStruct, ExecutorStruct,
                      NodePathStruct, NodeStruct, PathStruct,
                      ServiceCallbackStruct, SubscriptionCallbackStruct, TimerCallbackStruct)
+from .struct.node import NodePathKey
 from ..common import Summarizable, Summary, type_check_decorator, Util
-from ..exceptions import InvalidArgumentError, ItemNotFoundError, UnsupportedTypeError
+from ..exceptions import (InvalidArgumentError, ItemNotFoundError, MultipleItemFoundError,
+                          UnsupportedTypeError)
 from ..value_objects import (CallbackGroupStructValue, CallbackStructValue,
                              CommunicationStructValue, DiffNode, ExecutorStructValue,
                              NodePathStructValue, NodeStructValue, PathStructValue,
@@ -36,10 +40,36 @@ from ..value_objects import (CallbackGroupStructValue, CallbackStructValue,
 
 logger = logging.getLogger(__name__)
 
+CommunicationKey = tuple[str, str, str, int | None, int | None]
+
 DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING = 10
 
+# TODO: refactor Add callback_parameter property to CallbackStruct
+_CB_PARAM: dict[type[CallbackStruct], Callable[[CallbackStruct], Any]] = {
+    TimerCallbackStruct: attrgetter('period_ns'),
+    SubscriptionCallbackStruct: attrgetter('subscribe_topic_name'),
+    ServiceCallbackStruct: attrgetter('service_name'),
+}
+
+_CALLBACK_NAME = attrgetter('callback_name')
+_CALLBACK_GROUP_NAME = attrgetter('callback_group_name')
+_EXECUTOR_NAME = attrgetter('executor_name')
+_NODE_NAME = attrgetter('node_name')
+_PATH_NAME = attrgetter('path_name')
+_SERVICE_NAME = attrgetter('service_name')
+_TOPIC_NAME = attrgetter('topic_name')
+
 
 class Architecture(Summarizable):
+    __slots__ = (
+        '_max_callback_construction_order_on_path_searching',
+        '_nodes', '_communications', '_executors', '_named_paths', '_unnamed_paths',
+        '_nodes_by_name', '_duplicate_node_names', '_comm_index',
+        '_callbacks_by_name', '_executors_by_name',
+        '_topic_names',
+        '_cache', '_node_values', '_path_values',
+    )
+
     def __init__(
         self,
         file_type: str,
@@ -59,47 +89,194 @@ class Architecture(Summarizable):
                                     ignore_topics,
                                     max_callback_construction_order_on_path_searching)
 
-        self._nodes: list[NodeStruct] = loaded.nodes
-        self._communications: list[CommunicationStruct] = loaded.communications
+        # Nodes and communications are only updated in place, so they are held as tuples
+        # that can be handed to NodePathSearcher as they are.
+        self._nodes: tuple[NodeStruct, ...] = tuple(loaded.nodes)
+        self._communications: tuple[CommunicationStruct, ...] = tuple(loaded.communications)
         self._executors: list[ExecutorStruct] = loaded.executors
-        self._paths = loaded.paths
+        self._named_paths: dict[str, PathStruct] = {}
+        self._unnamed_paths: list[PathStruct] = []
+        for path in loaded.paths:
+            if path.path_name is None:
+                self._unnamed_paths.append(path)
+            elif path.path_name in self._named_paths:
+                logger.warning(
+                    'Duplicate path name found. The latter path is ignored. '
+                    f'path_name: {path.path_name}')
+            else:
+                self._named_paths[path.path_name] = path
         self._verify(self._nodes)
 
+        self._nodes_by_name: dict[str, NodeStruct] = {}
+        self._duplicate_node_names: frozenset[str] = frozenset()
+        self._update_node_index()
+        self._comm_index: dict[CommunicationKey, CommunicationStruct] = {}
+        self._update_communication_index()
+        # Built on first rename and kept up to date by rename_callback/rename_executor.
+        self._callbacks_by_name: dict[str, CallbackStruct] | None = None
+        self._executors_by_name: dict[str, ExecutorStruct] | None = None
+        # Topics are only changed by rename_topic, so they are kept apart from self._cache.
+        self._topic_names: tuple[str, ...] | None = None
+
+        # Values derived from the structs above. Cleared whenever the architecture is updated.
+        self._cache: dict[str, Any] = {}
+        # Memoized to_value() of each node and named path, invalidated per struct.
+        # Node names may be duplicated, so nodes are keyed by their identity.
+        self._node_values: dict[int, NodeStructValue] = {}
+        self._path_values: dict[str, PathStructValue] = {}
+
     def get_node(self, node_name: str) -> NodeStructValue:
+        return self._get_node_value(self._get_node_struct(node_name))
+
+    def _get_node_struct(self, node_name: str) -> NodeStruct:
+        if node_name in self._duplicate_node_names:
+            raise MultipleItemFoundError(f'Failed to identify node. node_name: {node_name}')
         try:
-            return Util.find_one(lambda x: x.node_name == node_name, self.nodes)
-        except ItemNotFoundError:
+            return self._nodes_by_name[node_name]
+        except KeyError:
             msg = 'Failed to find node. '
             msg += f'node_name: {node_name}'
             raise ItemNotFoundError(msg)
 
+    def _update_node_index(self) -> None:
+        # Node names may be duplicated. The first node is indexed, and the duplicated
+        # names are recorded so that looking them up fails as ambiguous.
+        self._nodes_by_name = {}
+        duplicate_node_names: set[str] = set()
+        for node in self._nodes:
+            if self._nodes_by_name.setdefault(node.node_name, node) is not node:
+                duplicate_node_names.add(node.node_name)
+        self._duplicate_node_names = frozenset(duplicate_node_names)
+
+    def _update_communication_index(self) -> None:
+        self._comm_index = {}
+        for comm in self._communications:
+            key = (comm.publish_node_name, comm.subscribe_node_name, comm.topic_name,
+                   comm.publisher_construction_order, comm.subscription_construction_order)
+            self._comm_index.setdefault(key, comm)
+
+    def _get_communication_struct(self, key: CommunicationKey) -> CommunicationStruct:
+        try:
+            return self._comm_index[key]
+        except KeyError:
+            msg = 'Failed to find communication. '
+            msg += f'publisher_node_name: {key[0]}, '
+            msg += f'subscription_node_name: {key[1]}, '
+            msg += f'topic_name: {key[2]}, '
+            msg += f'publisher_construction_order: {key[3]}, '
+            msg += f'subscription_construction_order: {key[4]}'
+            raise ItemNotFoundError(msg)
+
+    def _get_node_path_struct(self, node_name: str, key: NodePathKey) -> NodePathStruct:
+        try:
+            return self._get_node_struct(node_name).paths_by_key[key]
+        except KeyError:
+            msg = 'Failed to find node path. '
+            msg += f'node_name: {node_name}, '
+            msg += f'publish_topic_name: {key[0]}, '
+            msg += f'subscribe_topic_name: {key[1]}, '
+            msg += f'publisher_construction_order: {key[2]}, '
+            msg += f'subscription_construction_order: {key[3]}'
+            raise ItemNotFoundError(msg)
+
+    def _get_cached(self, key: str, create: Callable[[], Any]) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = create()
+            self._cache[key] = value
+            return value
+
+    def _get_node_value(self, node: NodeStruct) -> NodeStructValue:
+        try:
+            return self._node_values[id(node)]
+        except KeyError:
+            value = node.to_value()
+            self._node_values[id(node)] = value
+            return value
+
+    def _get_path_value(self, path: PathStruct) -> PathStructValue:
+        if path.path_name is None:
+            return path.to_value()
+        try:
+            return self._path_values[path.path_name]
+        except KeyError:
+            value = path.to_value()
+            self._path_values[path.path_name] = value
+            return value
+
+    def _invalidate_cache(
+        self,
+        nodes: Collection[NodeStruct] | None = None,
+        path_names: Collection[str] | None = None
+    ) -> None:
+        # nodes and path_names list the structs that were updated.
+        # None means that any of them may have changed.
+        self._cache.clear()
+        if nodes is None:
+            self._node_values.clear()
+        else:
+            for node in nodes:
+                self._node_values.pop(id(node), None)
+        if path_names is None:
+            self._path_values.clear()
+        else:
+            for path_name in path_names:
+                self._path_values.pop(path_name, None)
+
+    @staticmethod
+    def _find_first(condition: Callable[[Any], bool], items: Iterable[Any], msg: str) -> Any:
+        # Unlike Util.find_one, stops at the first match without checking for duplicates.
+        try:
+            return next(item for item in items if condition(item))
+        except StopIteration:
+            raise ItemNotFoundError(msg)
+
     def get_executor(self, executor_name: str) -> ExecutorStructValue:
-        return Util.find_one(lambda x: x.executor_name == executor_name, self.executors)
+        return self._find_first(lambda x: x.executor_name == executor_name, self.executors,
+                                f'Failed to find executor. executor_name: {executor_name}')
 
     def get_callback_group(self, callback_group_name: str) -> CallbackGroupStructValue:
-        return Util.find_one(lambda x: x.callback_group_name == callback_group_name,
-                             self.callback_groups)
+        return self._find_first(
+            lambda x: x.callback_group_name == callback_group_name, self.callback_groups,
+            f'Failed to find callback group. callback_group_name: {callback_group_name}')
 
     @property
     def callback_groups(self) -> tuple[CallbackGroupStructValue, ...]:
-        return tuple(Util.flatten(_.callback_groups for _ in self.executors))
+        return self._get_cached(
+            'callback_groups',
+            lambda: tuple(v.to_value() for v in
+                          chain.from_iterable(_.callback_groups for _ in self._executors)))
 
     @property
     def callback_group_names(self) -> tuple[str, ...]:
-        return tuple(sorted(_.callback_group_name for _ in self.callback_groups))
+        return self._get_cached(
+            'callback_group_names',
+            lambda: tuple(sorted(map(_CALLBACK_GROUP_NAME, self.callback_groups))))
 
     @property
     def topic_names(self) -> tuple[str, ...]:
-        topic_names = {_.topic_name for _ in self.publishers}
-        topic_names |= {_.topic_name for _ in self.subscriptions}
-        return tuple(sorted(topic_names))
+        if self._topic_names is None:
+            topic_names = {_.topic_name for _ in
+                           chain.from_iterable(n.publishers for n in self._nodes)}
+            topic_names |= {_.topic_name for _ in
+                            chain.from_iterable(n.subscriptions for n in self._nodes)}
+            self._topic_names = tuple(sorted(topic_names))
+        return self._topic_names
+
+    @property
+    def topic_names_set(self) -> frozenset[str]:
+        return self._get_cached('topic_names_set', lambda: frozenset(self.topic_names))
 
     def get_callback(self, callback_name: str) -> CallbackStructValue:
-        return Util.find_one(lambda x: x.callback_name == callback_name, self.callbacks)
+        return self._find_first(lambda x: x.callback_name == callback_name, self.callbacks,
+                                f'Failed to find callback. callback_name: {callback_name}')
 
     @property
     def callbacks(self) -> tuple[CallbackStructValue, ...]:
-        return tuple(Util.flatten(_.callbacks for _ in self.callback_groups))
+        return self._get_cached(
+            'callbacks',
+            lambda: tuple(chain.from_iterable(_.callbacks for _ in self.callback_groups)))
 
     def get_communication(
         self,
@@ -110,88 +287,49 @@ class Architecture(Summarizable):
         publisher_construction_order: int = 0,
         subscription_construction_order: int = 0
     ) -> CommunicationStructValue:
-        def is_target_comm(comm: CommunicationStructValue):
-            return comm.publish_node_name == publisher_node_name and \
-                comm.subscribe_node_name == subscription_node_name and \
-                comm.topic_name == topic_name and \
-                comm.publisher_construction_order == publisher_construction_order and \
-                comm.subscription_construction_order == subscription_construction_order
-
-        return Util.find_one(is_target_comm, self.communications)
+        comm = self._get_communication_struct(
+            (publisher_node_name, subscription_node_name, topic_name,
+             publisher_construction_order, subscription_construction_order))
+        return comm.to_value()
 
     def get_path(self, path_name: str) -> PathStructValue:
-        if path_name not in self.path_names:
+        named_path = self._named_paths.get(path_name)
+        if named_path is None:
             raise InvalidArgumentError(f'Failed to get named path. {path_name} not exist.')
 
-        named_path: PathStruct = Util.find_one(lambda x: x._path_name == path_name, self._paths)
-        return named_path.to_value()
+        return self._get_path_value(named_path)
 
     def add_path(self, path_name: str, path_info: PathStructValue) -> None:
-        if path_name in self.path_names:
+        if path_name in self._named_paths:
             raise InvalidArgumentError('Failed to add named path. Duplicate path name.')
 
         child: list[NodePathStruct | CommunicationStruct] = []
 
         for c in path_info.child:
             if isinstance(c, NodePathStructValue):
-                node_name = c.node_name
-                publish_topic_name = c.publish_topic_name
-                subscribe_topic_name = c.subscribe_topic_name
-                publisher_construction_order = c.publisher_construction_order
-                subscription_construction_order = c.subscription_construction_order
-
-                def is_target_node(node: NodeStruct):
-                    return node_name == node.node_name
-
-                def is_target_node_path(node_path: NodePathStruct):
-                    return (
-                        publish_topic_name == node_path.publish_topic_name and
-                        subscribe_topic_name == node_path.subscribe_topic_name and
-                        publisher_construction_order ==
-                        node_path.publisher_construction_order and
-                        subscription_construction_order ==
-                        node_path.subscription_construction_order
-                    )
-
-                node: NodeStruct = Util.find_one(is_target_node, self._nodes)
-                node_path: NodePathStruct = Util.find_one(is_target_node_path, node.paths)
+                node_path = self._get_node_path_struct(
+                    c.node_name,
+                    (c.publish_topic_name, c.subscribe_topic_name,
+                     c.publisher_construction_order, c.subscription_construction_order))
                 child.append(node_path)
 
             elif isinstance(c, CommunicationStructValue):
-                publish_node_name = c.publish_node_name
-                subscribe_node_name = c.subscribe_node_name
-                topic_name = c.topic_name
-                publisher_construction_order = c.publisher_construction_order
-                subscription_construction_order = c.subscription_construction_order
-
-                def is_target_comm(comm: CommunicationStruct):
-                    return publish_node_name == comm.publish_node_name and \
-                        subscribe_node_name == comm.subscribe_node_name and \
-                        topic_name == comm.topic_name and \
-                        publisher_construction_order == comm.publisher_construction_order and \
-                        subscription_construction_order == comm.subscription_construction_order
-
-                comm: CommunicationStruct = \
-                    Util.find_one(is_target_comm, self._communications)
+                comm = self._get_communication_struct(
+                    (c.publish_node_name, c.subscribe_node_name, c.topic_name,
+                     c.publisher_construction_order, c.subscription_construction_order))
                 child.append(comm)
 
             else:
                 raise UnsupportedTypeError('')
 
-        named_path_info = PathStruct(path_name, child)
-        self._paths.append(named_path_info)
+        self._named_paths[path_name] = PathStruct(path_name, child)
+        self._invalidate_cache(nodes=(), path_names=(path_name,))
 
     def remove_path(self, path_name: str) -> None:
-        if path_name not in self.path_names:
+        if self._named_paths.pop(path_name, None) is None:
             raise InvalidArgumentError(f'Failed to remove named path. {path_name} not exist.')
 
-        idx = None
-        for i, p in enumerate(self._paths):
-            if p.path_name == path_name:
-                idx = i
-
-        if idx is not None:
-            self._paths.pop(idx)
+        self._invalidate_cache(nodes=(), path_names=(path_name,))
 
     def update_path(self, path_name: str, path: PathStructValue) -> None:
         if path.path_name is None:
@@ -202,46 +340,66 @@ class Architecture(Summarizable):
 
     @property
     def nodes(self) -> tuple[NodeStructValue, ...]:
-        return tuple(v.to_value() for v in self._nodes)
+        return self._get_cached('nodes', lambda: tuple(map(self._get_node_value, self._nodes)))
 
     @property
     def node_names(self) -> tuple[str, ...]:
-        return tuple(sorted(_.node_name for _ in self._nodes))
+        return self._get_cached(
+            'node_names', lambda: tuple(sorted(map(_NODE_NAME, self._nodes))))
+
+    @property
+    def node_names_set(self) -> frozenset[str]:
+        return self._get_cached('node_names_set', lambda: frozenset(self._nodes_by_name))
 
     @property
     def executors(self) -> tuple[ExecutorStructValue, ...]:
-        return tuple(v.to_value() for v in self._executors)
+        return self._get_cached(
+            'executors', lambda: tuple(v.to_value() for v in self._executors))
 
     @property
     def executor_names(self) -> tuple[str, ...]:
-        return tuple(sorted(_.executor_name for _ in self._executors))
+        return self._get_cached(
+            'executor_names',
+            lambda: tuple(sorted(map(_EXECUTOR_NAME, self._executors))))
 
     @property
     def paths(self) -> tuple[PathStructValue, ...]:
-        return tuple([v.to_value() for v in self._paths])
+        return self._get_cached(
+            'paths',
+            lambda: tuple(map(self._get_path_value,
+                              chain(self._named_paths.values(), self._unnamed_paths))))
 
     @property
     def path_names(self) -> tuple[str, ...]:
-        return tuple(sorted(v.path_name for v in self._paths if v.path_name is not None))
+        return self._get_cached('path_names', lambda: tuple(sorted(self._named_paths)))
 
     @property
     def communications(self) -> tuple[CommunicationStructValue, ...]:
-        return tuple(v.to_value() for v in self._communications)
+        return self._get_cached(
+            'communications', lambda: tuple(v.to_value() for v in self._communications))
 
     @property
     def publishers(self) -> tuple[PublisherStructValue, ...]:
-        publishers = Util.flatten(_.publishers for _ in self.nodes)
-        return tuple(sorted(publishers, key=lambda x: x.topic_name))
+        def create() -> tuple[PublisherStructValue, ...]:
+            publishers = (v.to_value() for v in
+                          chain.from_iterable(_.publishers for _ in self._nodes))
+            return tuple(sorted(publishers, key=_TOPIC_NAME))
+        return self._get_cached('publishers', create)
 
     @property
     def subscriptions(self) -> tuple[SubscriptionStructValue, ...]:
-        subscriptions = Util.flatten(_.subscriptions for _ in self.nodes)
-        return tuple(sorted(subscriptions, key=lambda x: x.topic_name))
+        def create() -> tuple[SubscriptionStructValue, ...]:
+            subscriptions = (v.to_value() for v in
+                             chain.from_iterable(_.subscriptions for _ in self._nodes))
+            return tuple(sorted(subscriptions, key=_TOPIC_NAME))
+        return self._get_cached('subscriptions', create)
 
     @property
     def services(self) -> tuple[ServiceStructValue, ...]:
-        services = Util.flatten(_.services for _ in self.nodes)
-        return tuple(sorted(services, key=lambda x: x.service_name))
+        def create() -> tuple[ServiceStructValue, ...]:
+            services = (v.to_value() for v in chain.from_iterable(_.services for _ in self._nodes))
+            return tuple(sorted(services, key=_SERVICE_NAME))
+        return self._get_cached('services', create)
 
     @property
     def summary(self) -> Summary:
@@ -250,6 +408,8 @@ class Architecture(Summarizable):
         })
 
     def export(self, file_path: str, force: bool = False):
+        from .architecture_exporter import ArchitectureExporter
+
         exporter = ArchitectureExporter(
             self.nodes, self.executors, self.paths, force)
         exporter.execute(file_path)
@@ -261,8 +421,9 @@ class Architecture(Summarizable):
         node_filter: Callable[[str], bool] | None = None,
         communication_filter: Callable[[str], bool] | None = None,
     ) -> list[PathStructValue]:
+        node_names_set = self.node_names_set
         for node_name in node_names:
-            if node_name not in self.node_names:
+            if node_name not in node_names_set:
                 raise ItemNotFoundError(f'Failed to find node. {node_name}')
 
         default_depth = 15  # When the depth is 15, the process takes only a few seconds.
@@ -288,7 +449,7 @@ class Architecture(Summarizable):
 
         # Search
         path_searcher = NodePathSearcher(
-            tuple(self._nodes), tuple(self._communications), node_filter, communication_filter)
+            self._nodes, self._communications, node_filter, communication_filter)
         paths = [v.to_value() for v in
                  path_searcher.search(*node_names, max_node_depth=max_node_depth)]
 
@@ -310,6 +471,7 @@ class Architecture(Summarizable):
         path_left: PathStructValue,
         path_right: PathStructValue
     ) -> PathStructValue:
+        from .combine_path import CombinePath
 
         def get_node(node_name: str) -> NodeStructValue:
             return self.get_node(node_name)
@@ -334,25 +496,16 @@ class Architecture(Summarizable):
             if callbacks is None:
                 continue
 
-            callback_params: list[tuple[str, str | int, str, int]] = []
-            for callback in callbacks:
-                cb_type = callback.callback_type_name
-                symbol = callback.symbol
-                # TODO: refactor Add callback_parameter property to CallbackStruct
-                cb_param: str | int
-                if isinstance(callback, TimerCallbackStruct):
-                    cb_param = callback.period_ns
-                elif isinstance(callback, SubscriptionCallbackStruct):
-                    cb_param = callback.subscribe_topic_name
-                elif isinstance(callback, ServiceCallbackStruct):
-                    cb_param = callback.service_name
-                else:
-                    continue
-                callback_params.append((cb_type, cb_param, symbol, callback.construction_order))
-
-            counter = Counter(callback_params)
-
-            for uniqueness_violated in [param for param, count in counter.items() if count >= 2]:
+            # Callback structs are leaf classes, so they are dispatched by their exact class.
+            counter = Counter(
+                (callback.callback_type_name,
+                 get_param(callback),
+                 callback.symbol,
+                 callback.construction_order)
+                for callback in callbacks
+                if (get_param := _CB_PARAM.get(callback.__class__)) is not None)
+
+            for uniqueness_violated in (k for k, count in counter.items() if count >= 2):
                 logger.warning(
                     ('Duplicate parameter callback found. '
                      f'node_name: {node.node_name}, '
@@ -376,8 +529,7 @@ class Architecture(Summarizable):
             name of publish topic of target node_path
 
         """
-        node: NodeStruct =\
-            Util.find_one(lambda x: x.node_name == node_name, self._nodes)
+        node = self._get_node_struct(node_name)
 
         if publish_topic_name not in node.publish_topic_names:
             raise ItemNotFoundError('{pub_topic_name} is not found in {node_name}')
@@ -388,12 +540,8 @@ class Architecture(Summarizable):
         context_reader = AssignContextReader(node)
         context_reader.update_message_context(context_type,
                                               subscribe_topic_name, publish_topic_name)
-        node.update_node_path(
-            NodeValuesLoaded._search_node_paths(
-                                node,
-                                context_reader,
-                                self._max_callback_construction_order_on_path_searching)
-                            )
+        self._refresh_node_paths(node, context_reader)
+        self._invalidate_cache(nodes=(node,))
 
     def insert_publisher_callback(self, node_name: str,
                                   publish_topic_name: str, callback_name: str,
@@ -413,17 +561,13 @@ class Architecture(Summarizable):
             construction order of target publisher
 
         """
-        node: NodeStruct = Util.find_one(lambda x: x.node_name == node_name, self._nodes)
+        node = self._get_node_struct(node_name)
 
         node.insert_publisher_callback(publish_topic_name,
                                        callback_name, publisher_construction_order)
 
-        node.update_node_path(
-            NodeValuesLoaded._search_node_paths(
-                                node,
-                                AssignContextReader(node),
-                                self._max_callback_construction_order_on_path_searching)
-                            )
+        self._refresh_node_paths(node)
+        self._invalidate_cache(nodes=(node,))
 
     def insert_variable_passing(self, node_name: str,
                                 callback_name_write: str, callback_name_read: str) -> None:
@@ -440,16 +584,12 @@ class Architecture(Summarizable):
             name of read callback to be inserted in variable_passing
 
         """
-        node: NodeStruct = Util.find_one(lambda x: x.node_name == node_name, self._nodes)
+        node = self._get_node_struct(node_name)
 
         node.insert_variable_passing(callback_name_write, callback_name_read)
 
-        node.update_node_path(
-            NodeValuesLoaded._search_node_paths(
-                                node,
-                                AssignContextReader(node),
-                                self._max_callback_construction_order_on_path_searching)
-                            )
+        self._refresh_node_paths(node)
+        self._invalidate_cache(nodes=(node,))
 
     def remove_publisher_callback(self, node_name: str,
                                   publish_topic_name: str, callback_name: str,
@@ -469,17 +609,13 @@ class Architecture(Summarizable):
             construction order of target publisher
 
         """
-        node: NodeStruct = Util.find_one(lambda x: x.node_name == node_name, self._nodes)
+        node = self._get_node_struct(node_name)
 
         node.remove_publisher_and_callback(publish_topic_name,
                                            callback_name, publisher_construction_order)
 
-        node.update_node_path(
-            NodeValuesLoaded._search_node_paths(
-                                node,
-                                AssignContextReader(node),
-                                self._max_callback_construction_order_on_path_searching)
-                            )
+        self._refresh_node_paths(node)
+        self._invalidate_cache(nodes=(node,))
 
     def remove_variable_passing(self, node_name: str,
                                 callback_name_write: str, callback_name_read: str) -> None:
@@ -496,7 +632,7 @@ class Architecture(Summarizable):
             name of read callback to be removed from variable_passing
 
         """
-        node: NodeStruct = Util.find_one(lambda x: x.node_name == node_name, self._nodes)
+        node = self._get_node_struct(node_name)
 
         node.remove_variable_passing(callback_name_write, callback_name_read)
 
@@ -514,12 +650,62 @@ class Architecture(Summarizable):
                         callback_write.construction_order,
                         publish_topic.topic_name,
                         publish_topic.construction_order)
-            node.update_node_path(
-                NodeValuesLoaded._search_node_paths(
-                                    node,
-                                    context_reader,
-                                    self._max_callback_construction_order_on_path_searching)
-                                )
+            self._refresh_node_paths(node, context_reader)
+        self._invalidate_cache(nodes=(node,))
+
+    def _refresh_node_paths(
+        self,
+        node: NodeStruct,
+        context_reader: AssignContextReader | None = None
+    ) -> None:
+        # The reader is not cached per node: node paths are replaced right below,
+        # and the new paths carry contexts (e.g. generated callback chains) it does not know.
+        if context_reader is None:
+            context_reader = AssignContextReader(node)
+        node.update_node_path(
+            NodeValuesLoaded._search_node_paths(
+                node,
+                context_reader,
+                self._max_callback_construction_order_on_path_searching))
+
+    @staticmethod
+    def _build_name_index(items: Iterable[Any], key: Callable[[Any], str]) -> dict[str, Any]:
+        # Keep the first item of each name, which is the one find_similar_one returns.
+        index: dict[str, Any] = {}
+        for item in items:
+            index.setdefault(key(item), item)
+        return index
+
+    @staticmethod
+    def _find_by_name(
+        index: dict[str, Any],
+        name: str,
+        get_items: Callable[[], Iterable[Any]],
+        key: Callable[[Any], str]
+    ) -> Any:
+        try:
+            return index[name]
+        except KeyError:
+            # A miss is not always final. Renaming the indexed item of a duplicated
+            # name drops that name, while other items may still carry it.
+            # find_similar_one scans all items: it returns the first exact match,
+            # or raises with a similar name suggested.
+            return Util.find_similar_one(name, list(get_items()), key)
+
+    @staticmethod
+    def _rename_index(
+        index: dict[str, Any],
+        src: str,
+        dst: str,
+        item: Any
+    ) -> dict[str, Any] | None:
+        if dst in index:
+            # Which item comes first depends on the original order. Rebuild on the next use.
+            return None
+        if index.get(src) is item:
+            del index[src]
+        index[dst] = item
+        return index
 
     def rename_callback(self, src: str, dst: str) -> None:
         """
@@ -533,11 +719,19 @@ class Architecture(Summarizable):
             updated callback name
 
         """
-        cb_s: list[CallbackStruct] =\
-            Util.flatten(cb_g.callbacks for cb_g in
-                         Util.flatten([e.callback_groups for e in self._executors]))
-        c: CallbackStruct = Util.find_similar_one(src, cb_s, lambda x: x.callback_name)
+        def iter_callbacks() -> Iterator[CallbackStruct]:
+            return (callback
+                    for executor in self._executors
+                    for cb_g in executor.callback_groups
+                    for callback in cb_g.callbacks)
+
+        if self._callbacks_by_name is None:
+            self._callbacks_by_name = self._build_name_index(iter_callbacks(), _CALLBACK_NAME)
+        c: CallbackStruct = self._find_by_name(
+            self._callbacks_by_name, src, iter_callbacks, _CALLBACK_NAME)
         c.callback_name = dst
+        self._callbacks_by_name = self._rename_index(self._callbacks_by_name, src, dst, c)
+        self._invalidate_cache()
 
     def rename_node(self, src: str, dst: str) -> None:
         """
@@ -551,6 +745,9 @@ class Architecture(Summarizable):
             updated node name
 
         """
+        if src not in self._nodes_by_name:
+            return
+
         for n in self._nodes:
             n.rename_node(src, dst)
 
@@ -560,6 +757,10 @@ class Architecture(Summarizable):
         for c in self._communications:
             c.rename_node(src, dst)
 
+        self._update_node_index()
+        self._update_communication_index()
+        self._invalidate_cache()
+
     def rename_path(self, src: str, dst: str) -> None:
         """
         Update path name from "src" to "dst" in architecture.
@@ -572,8 +773,15 @@ class Architecture(Summarizable):
             updated path name
 
         """
-        p: PathStruct = Util.find_similar_one(src, self._paths, lambda x: x.path_name)
+        if src != dst and dst in self._named_paths:
+            raise InvalidArgumentError('Failed to rename named path. Duplicate path name.')
+
+        p: PathStruct = self._find_by_name(
+            self._named_paths, src, self._named_paths.values, _PATH_NAME)
         p.path_name = dst
+        # Rebuilt so that the renamed path keeps its position.
+        self._named_paths = {dst if k == src else k: v for k, v in self._named_paths.items()}
+        self._invalidate_cache(nodes=(), path_names=(src, dst))
 
     def rename_executor(self, src: str, dst: str) -> None:
         """
@@ -587,8 +795,13 @@ class Architecture(Summarizable):
             updated executor name
 
         """
-        e: ExecutorStruct = Util.find_similar_one(src, self._executors, lambda x: x.executor_name)
+        if self._executors_by_name is None:
+            self._executors_by_name = self._build_name_index(self._executors, _EXECUTOR_NAME)
+        e: ExecutorStruct = self._find_by_name(
+            self._executors_by_name, src, lambda: self._executors, _EXECUTOR_NAME)
         e.executor_name = dst
+        self._executors_by_name = self._rename_index(self._executors_by_name, src, dst, e)
+        self._invalidate_cache()
 
     def rename_topic(self, src: str, dst: str) -> None:
         """
@@ -602,6 +815,9 @@ class Architecture(Summarizable):
             updated topic name
 
         """
+        if src not in self.topic_names_set:
+            return
+
         for n in self._nodes:
             n.rename_topic(src, dst)
 
@@ -611,6 +827,10 @@ class Architecture(Summarizable):
         for c in self._communications:
             c.rename_topic(src, dst)
 
+        self._update_communication_index()
+        self._topic_names = None
+        self._invalidate_cache()
+
     @staticmethod
     def diff_node_names(
         left_arch: Architecture,
@@ -705,35 +925,99 @@ class Architecture(Summarizable):
         return DiffNode(left_node, right_node).diff_node_subs()
 
 
+class _MessageContextRecord:
+    """Message context held by AssignContextReader, in place of the dict form."""
+
+    __slots__ = ('context_type', 'subscription_topic_name', 'publisher_topic_name',
+                 'publisher_construction_order', 'subscription_construction_order', 'callbacks')
+
+    def __init__(
+        self,
+        context_type: str,
+        subscription_topic_name: str,
+        publisher_topic_name: str,
+        publisher_construction_order: int | None,
+        subscription_construction_order: int | None,
+        callbacks: list[str] | None = None
+    ) -> None:
+        self.context_type = context_type
+        self.subscription_topic_name = subscription_topic_name
+        self.publisher_topic_name = publisher_topic_name
+        self.publisher_construction_order = publisher_construction_order
+        self.subscription_construction_order = subscription_construction_order
+        self.callbacks = callbacks
+
+    @staticmethod
+    def from_dict(context: dict) -> _MessageContextRecord:
+        return _MessageContextRecord(
+            context['context_type'],
+            context['subscription_topic_name'],
+            context['publisher_topic_name'],
+            context.get('publisher_construction_order', 0),
+            context.get('subscription_construction_order', 0),
+            context.get('callbacks'))
+
+    def to_dict(self) -> dict:
+        context: dict[str, Any] = {
+            'context_type': self.context_type,
+            'subscription_topic_name': self.subscription_topic_name,
+            'publisher_topic_name': self.publisher_topic_name,
+            'publisher_construction_order': self.publisher_construction_order,
+            'subscription_construction_order': self.subscription_construction_order
+        }
+        if self.callbacks is not None:
+            context['callbacks'] = self.callbacks
+        return context
+
+
 class AssignContextReader(ArchitectureReader):
     """MessageContext of NodeStruct implemented version of ArchitectureReader."""
 
+    __slots__ = ('_node', '_paths_without_context', '_contexts', '_contexts_by_topics')
+
     def __init__(self, node: NodeStruct) -> None:
-        contexts = [path.message_context for path in node.paths]
         self._node = node
-        self._contexts = \
-            [context.to_dict() for context in contexts if context is not None]
+        # Paths whose contexts are not in self._contexts yet,
+        # grouped by (subscription topic, publisher topic).
+        self._paths_without_context: defaultdict[tuple[str | None, str | None],
+                                                 list[NodePathStruct]] = defaultdict(list)
+        # Contexts in insertion order, keyed by id() so that they can be removed one by one.
+        self._contexts: dict[int, _MessageContextRecord] = {}
+        # The same records as self._contexts, grouped by (subscription topic, publisher topic).
+        self._contexts_by_topics: defaultdict[tuple[str, str],
+                                              list[_MessageContextRecord]] = defaultdict(list)
+        paths_without_context = self._paths_without_context
+        all_contexts = self._contexts
+        contexts_by_topics = self._contexts_by_topics
+        for path in node.paths:
+            message_context = path.message_context
+            if message_context is None:
+                paths_without_context[
+                    (path.subscribe_topic_name, path.publish_topic_name)].append(path)
+                continue
+            context = _MessageContextRecord.from_dict(message_context.to_dict())
+            all_contexts[id(context)] = context
+            contexts_by_topics[
+                (context.subscription_topic_name, context.publisher_topic_name)
+            ].append(context)
 
     def update_message_context(self, context_type: str,
                                subscribe_topic_name: str, publish_topic_name: str) -> None:
-        for context in self._contexts:
-            if (context['subscription_topic_name'], context['publisher_topic_name']) ==\
-               (subscribe_topic_name, publish_topic_name):
-                context['context_type'] = context_type
-        for path in self._node.paths:
-            if path.message_context is not None:
-                # already processed by the above self._contexts process
-                continue
-            else:
-                if (path.subscribe_topic_name, path.publish_topic_name) ==\
-                        (subscribe_topic_name, publish_topic_name):
-                    self._contexts.append({
-                        'context_type': context_type,
-                        'subscription_topic_name': subscribe_topic_name,
-                        'publisher_topic_name': publish_topic_name,
-                        'publisher_construction_order': path.publisher_construction_order,
-                        'subscription_construction_order': path.subscription_construction_order
-                    })
+        topics = (subscribe_topic_name, publish_topic_name)
+        for context in self._contexts_by_topics.get(topics, ()):
+            context.context_type = context_type
+        paths = self._paths_without_context.get(topics)
+        if not paths:
+            return
+
+        all_contexts = self._contexts
+        contexts = self._contexts_by_topics[topics]
+        for path in paths:
+            context = _MessageContextRecord(
+                context_type, subscribe_topic_name, publish_topic_name,
+                path.publisher_construction_order, path.subscription_construction_order)
+            all_contexts[id(context)] = context
+            contexts.append(context)
 
     def remove_callback_chain(
         self,
@@ -742,21 +1026,24 @@ class AssignContextReader(ArchitectureReader):
         publish_topic_name: str,
         publisher_construction_order: int
     ) -> None:
-        self._contexts = [
-            context for context in self._contexts
-            if (context['subscription_topic_name'],
-                context.get('subscription_construction_order', 0),
-                context['publisher_topic_name'],
-                context.get('publisher_construction_order', 0),
-                context['context_type']) != (subscribe_topic_name,
-                                             subscription_construction_order,
-                                             publish_topic_name,
-                                             publisher_construction_order,
-                                             'callback_chain')
-        ]
+        contexts = self._contexts_by_topics.get((subscribe_topic_name, publish_topic_name))
+        if not contexts:
+            return
+
+        remaining = []
+        for context in contexts:
+            if (context.subscription_construction_order,
+                context.publisher_construction_order,
+                context.context_type) == (subscription_construction_order,
+                                          publisher_construction_order,
+                                          'callback_chain'):
+                del self._contexts[id(context)]
+            else:
+                remaining.append(context)
+        contexts[:] = remaining
 
     def get_message_contexts(self, _) -> Sequence[dict]:
-        return self._contexts
+        return [context.to_dict() for context in self._contexts.values()]
 
     def get_callback_groups(self):
         pass
@@ -800,6 +1087,7 @@ class AssignContextReader(ArchitectureReader):
 
 # NOTE: DiffArchitecture may be changed when it is refactored.
 class DiffArchitecture:
+    __slots__ = ('_left_arch', '_right_arch')
 
     def __init__(
         self,
@@ -810,17 +1098,24 @@ class DiffArchitecture:
         self._right_arch = right_arch
 
     def diff_node_names(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
-        set_left_node_names = set(self._left_arch.node_names)
-        set_right_node_names = set(self._right_arch.node_names)
-        common_node_names = set_left_node_names & set_right_node_names
-        left_only_names = tuple(set_left_node_names - common_node_names)
-        right_only_names = tuple(set_right_node_names - common_node_names)
-        return left_only_names, right_only_names
+        left_only_names, right_only_names = self._diff_node_names_set()
+        return tuple(left_only_names), tuple(right_only_names)
+
+    def _diff_node_names_set(self) -> tuple[frozenset[str], frozenset[str]]:
+        if self._left_arch is self._right_arch:
+            return frozenset(), frozenset()
+        set_left_node_names = self._left_arch.node_names_set
+        set_right_node_names = self._right_arch.node_names_set
+        return (set_left_node_names - set_right_node_names,
+                set_right_node_names - set_left_node_names)
 
     def diff_topic_names(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
-        set_left_topics = set(self._left_arch.topic_names)
-        set_right_topics = set(self._right_arch.topic_names)
-        common_node_topics = set_left_topics & set_right_topics
-        left_only_topics = tuple(set_left_topics - common_node_topics)
-        right_only_topics = tuple(set_right_topics - common_node_topics)
-        return left_only_topics, right_only_topics
+        left_only_topics, right_only_topics = self._diff_topic_names_set()
+        return tuple(left_only_topics), tuple(right_only_topics)
+
+    def _diff_topic_names_set(self) -> tuple[frozenset[str], frozenset[str]]:
+        if self._left_arch is self._right_arch:
+            return frozenset(), frozenset()
+        set_left_topics = self._left_arch.topic_names_set
+        set_right_topics = self._right_arch.topic_names_set
+        return set_left_topics - set_right_topics, set_right_topics - set_left_topics
@@ -30,6 +30,8 @@ IGNORE_TOPICS = ['/parameter_events', '/rosout', '/clock']
 class ArchitectureReader(metaclass=ABCMeta):
     """Architecture reader base class."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_node_names_and_cb_symbols(
         self,
@@ -26,6 +26,8 @@ from ...common import Util
 from ...exceptions import ItemNotFoundError
 from ...value_objects import (NodeStructValue, PublishTopicInfoValue)
 
+NodePathKey = tuple[str | None, str | None, int | None, int | None]
+
 
 class NodeStruct():
     """Executor info for architecture."""
@@ -48,6 +50,7 @@ class NodeStruct():
         self._timers = timers
         self._callback_groups = callback_groups
         self._node_paths = node_paths
+        self._node_paths_by_key: dict[NodePathKey, NodePathStruct] | None = None
         self._variable_passings_info = variable_passings
 
     @property
@@ -104,6 +107,18 @@ class NodeStruct():
     def paths(self) -> list[NodePathStruct]:
         return self._node_paths
 
+    @property
+    def paths_by_key(self) -> dict[NodePathKey, NodePathStruct]:
+        # key: (publish_topic_name, subscribe_topic_name,
+        #       publisher_construction_order, subscription_construction_order)
+        if self._node_paths_by_key is None:
+            self._node_paths_by_key = {}
+            for path in self._node_paths:
+                key = (path.publish_topic_name, path.subscribe_topic_name,
+                       path.publisher_construction_order, path.subscription_construction_order)
+                self._node_paths_by_key.setdefault(key, path)
+        return self._node_paths_by_key
+
     @property
     def variable_passings(self) -> list[VariablePassingStruct] | None:
         return self._variable_passings_info
@@ -181,6 +196,7 @@ class NodeStruct():
 
     def update_node_path(self, paths: list[NodePathStruct]) -> None:
         self._node_paths = paths
+        self._node_paths_by_key = None
 
     # def update_message_context(self, node_name: str, context_type: str,
     #                            sub_topic_name: str, pub_topic_name: str):
@@ -285,6 +301,8 @@ class NodeStruct():
                 v.rename_node(src, dst)
 
     def rename_topic(self, src: str, dst: str) -> None:
+        self._node_paths_by_key = None
+
         for p in self._publishers:
             p.rename_topic(src, dst)
 
@@ -81,6 +81,8 @@ class Summary(UserDict):
 class Summarizable(metaclass=ABCMeta):
     """Abstract base class that have summary property."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def summary(self) -> Summary:
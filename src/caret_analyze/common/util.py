@@ -184,16 +184,26 @@ class Util:
 
         """
         similarity = 0.0
+        # SequenceMatcher caches its analysis of the second sequence,
+        # so the target is set once and only the candidate is swapped.
+        matcher = difflib.SequenceMatcher(None, b=target_name)
         for item in items:
-            distance = difflib.SequenceMatcher(None, key(item), target_name).ratio()
+            name = key(item)
+            if name == target_name:
+                # An exact match is the first item whose ratio() is 1.0.
+                return item
+            matcher.set_seq1(name)
+            # real_quick_ratio() and quick_ratio() are cheap upper bounds of ratio(),
+            # so items that cannot beat the current best are skipped as in get_close_matches.
+            if matcher.real_quick_ratio() <= similarity or matcher.quick_ratio() <= similarity:
+                continue
+            distance = matcher.ratio()
             if (distance > similarity):
                 similarity = distance
                 most_similar_item = item
 
-        assert 0.0 <= similarity <= 1.0
-        if (similarity == 1.0):
-            return most_similar_item
-        elif (similarity > th):
+        assert 0.0 <= similarity < 1.0
+        if (similarity > th):
             msg = 'Arguments may be wrong.'
             msg += f" Isn't it '{key(most_similar_item)}'?"
             raise ItemNotFoundError(msg)
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-
+from typing import Any
 
 from .lttng import Lttng, LttngEventFilter
 from ...architecture.reader_interface import ArchitectureReader
@@ -44,6 +44,30 @@ class ArchitectureReaderLttng(ArchitectureReader):
         self._lttng = Lttng(
             trace_dir, event_filters=[LttngEventFilter.init_pass_filter()],
             validate=False)
+        # Per-node values keyed by (node name, node id).
+        # NodeValue itself is not used as a key because ValueObject hashing walks all properties.
+        self._node_values: dict[tuple[str, str | None], dict[str, Sequence[Any]]] = {}
+
+    def _get_node_values(self, node: NodeValue) -> dict[str, Sequence[Any]]:
+        # Architecture loading asks for every kind of value of each node,
+        # so they are fetched together on the first request for the node.
+        key = (node.node_name, node.node_id)
+        try:
+            return self._node_values[key]
+        except KeyError:
+            lttng = self._lttng
+            values: dict[str, Sequence[Any]] = {
+                'timer_callbacks': lttng.get_timer_callbacks(node),
+                'subscription_callbacks': lttng.get_subscription_callbacks(node),
+                'service_callbacks': lttng.get_service_callbacks(node),
+                'publishers': lttng.get_publishers(node),
+                'timers': lttng.get_timers(node),
+                'callback_groups': lttng.get_callback_groups(node),
+                'subscriptions': lttng.get_subscriptions(node),
+                'services': lttng.get_services(node),
+            }
+            self._node_values[key] = values
+            return values
 
     def get_node_names_and_cb_symbols(
         self,
@@ -58,7 +82,7 @@ class ArchitectureReaderLttng(ArchitectureReader):
         self,
         node: NodeValue
     ) -> Sequence[TimerCallbackValue]:
-        return self._lttng.get_timer_callbacks(node)
+        return self._get_node_values(node)['timer_callbacks']
 
     def get_variable_passings(
         self,
@@ -81,31 +105,31 @@ class ArchitectureReaderLttng(ArchitectureReader):
         self,
         node: NodeValue
     ) -> Sequence[SubscriptionCallbackValue]:
-        return self._lttng.get_subscription_callbacks(node)
+        return self._get_node_values(node)['subscription_callbacks']
 
     def get_service_callbacks(
         self,
         node: NodeValue
     ) -> Sequence[ServiceCallbackValue]:
-        return self._lttng.get_service_callbacks(node)
+        return self._get_node_values(node)['service_callbacks']
 
     def get_publishers(
         self,
         node: NodeValue
     ) -> Sequence[PublisherValue]:
-        return self._lttng.get_publishers(node)
+        return self._get_node_values(node)['publishers']
 
     def get_timers(
         self,
         node: NodeValue
     ) -> Sequence[TimerValue]:
-        return self._lttng.get_timers(node)
+        return self._get_node_values(node)['timers']
 
     def get_callback_groups(
         self,
         node: NodeValue
     ) -> Sequence[CallbackGroupValue]:
-        return self._lttng.get_callback_groups(node)
+        return self._get_node_values(node)['callback_groups']
 
     def get_paths(
         self
@@ -116,10 +140,10 @@ class ArchitectureReaderLttng(ArchitectureReader):
         self,
         node: NodeValue
     ) -> Sequence[SubscriptionValue]:
-        return self._lttng.get_subscriptions(node)
+        return self._get_node_values(node)['subscriptions']
 
     def get_services(
         self,
         node: NodeValue
     ) -> Sequence[ServiceValue]:
-        return self._lttng.get_services(node)
+        return self._get_node_values(node)['services']
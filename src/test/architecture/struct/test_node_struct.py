@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from caret_analyze.architecture.struct import (NodeStruct,
+from caret_analyze.architecture.struct import (NodePathStruct, NodeStruct,
                                                PublisherStruct, SubscriptionStruct)
 
 
@@ -45,3 +45,22 @@ class TestNodeStruct:
         subs = node_struct.get_subscription('topic2', 1)
         assert subs.topic_name == 'topic2'
         assert subs.construction_order == 1
+
+    def test_paths_by_key(self, mocker):
+        path_mock0 = mocker.Mock(spec=NodePathStruct)
+        mocker.patch.object(path_mock0, 'publish_topic_name', 'pub')
+        mocker.patch.object(path_mock0, 'subscribe_topic_name', 'sub')
+        mocker.patch.object(path_mock0, 'publisher_construction_order', 0)
+        mocker.patch.object(path_mock0, 'subscription_construction_order', 0)
+        path_mock1 = mocker.Mock(spec=NodePathStruct)
+        mocker.patch.object(path_mock1, 'publish_topic_name', 'pub')
+        mocker.patch.object(path_mock1, 'subscribe_topic_name', None)
+        mocker.patch.object(path_mock1, 'publisher_construction_order', 0)
+        mocker.patch.object(path_mock1, 'subscription_construction_order', None)
+
+        node_struct = NodeStruct('node', [], [], [], [], [path_mock0], None, None)
+        assert node_struct.paths_by_key == {('pub', 'sub', 0, 0): path_mock0}
+
+        node_struct.update_node_path([path_mock0, path_mock1])
+        assert node_struct.paths_by_key == {('pub', 'sub', 0, 0): path_mock0,
+                                            ('pub', None, 0, None): path_mock1}
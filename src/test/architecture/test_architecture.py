@@ -219,6 +219,7 @@ class TestArchitecture:
 
         node_mock = mocker.Mock(spec=NodeStruct)
         node_struct_mock = mocker.Mock(spec=NodeStructValue)
+        mocker.patch.object(node_mock, 'node_name', 'node_name')
         mocker.patch.object(node_struct_mock, 'node_name', 'node_name')
         mocker.patch.object(node_mock, 'to_value', return_value=node_struct_mock)
         mocker.patch.object(node_mock, 'callbacks', [])
@@ -239,6 +240,33 @@ class TestArchitecture:
         with pytest.raises(ItemNotFoundError):
             arch.get_node('node_not_exist')
 
+    def test_get_node_duplicated(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        mocker.patch.object(ArchitectureReaderFactory,
+                            'create_instance', return_value=reader_mock)
+
+        loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
+        mocker.patch('caret_analyze.architecture.architecture.ArchitectureLoaded',
+                     return_value=loaded_mock)
+
+        node_mock_0 = mocker.Mock(spec=NodeStruct)
+        node_mock_1 = mocker.Mock(spec=NodeStruct)
+        for node_mock in (node_mock_0, node_mock_1):
+            mocker.patch.object(node_mock, 'node_name', 'node_name')
+            mocker.patch.object(node_mock, 'to_value',
+                                return_value=mocker.Mock(spec=NodeStructValue))
+            mocker.patch.object(node_mock, 'callbacks', [])
+
+        mocker.patch.object(loaded_mock, 'paths', [])
+        mocker.patch.object(loaded_mock, 'nodes', [node_mock_0, node_mock_1])
+        mocker.patch.object(loaded_mock, 'communications', [])
+        mocker.patch.object(loaded_mock, 'executors', [])
+
+        arch = Architecture('file_type', 'file_path')
+        with pytest.raises(MultipleItemFoundError):
+            arch.get_node('node_name')
+        assert arch.nodes == (node_mock_0.to_value(), node_mock_1.to_value())
+
     def test_full_architecture(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
@@ -1221,6 +1249,10 @@ nodes:
         with pytest.raises(InvalidArgumentError):
             arch.get_path('target_path_1')
 
+        with pytest.raises(InvalidArgumentError):
+            arch.rename_path('target_path_0', 'changed_path')
+        assert arch.path_names == ('changed_path', 'target_path_0')
+
         # define path renamed text
         renamed_architecture_text = \
             self.template_architecture_rename.substitute(node='/node_1',
@@ -1237,57 +1269,105 @@ nodes:
         assert set(arch.paths) == set(arch_expected.paths)
         assert set(arch.executors) == set(arch_expected.executors)
 
+        arch.rename_path('changed_path', 'changed_path')
+        arch.rename_path('target_path_0', 'changed_path_0')
+        assert [p.path_name for p in arch.paths] == ['changed_path_0', 'changed_path']
+
 
 class TestArchitectureDiff:
 
     def test_diff_node_names(self, mocker):
         architecture_mock1 = mocker.Mock(spec=Architecture)
         architecture_mock2 = mocker.Mock(spec=Architecture)
-        mocker.patch.object(architecture_mock1, 'node_names', ('node1', 'node2'))
-        mocker.patch.object(architecture_mock2, 'node_names', ('node1', 'node3', 'node4'))
+        mocker.patch.object(architecture_mock1, 'node_names_set',
+                            frozenset(('node1', 'node2')))
+        mocker.patch.object(architecture_mock2, 'node_names_set',
+                            frozenset(('node1', 'node3', 'node4')))
         node_names_in_mock1, node_names_in_mock2 = \
             Architecture.diff_node_names(architecture_mock1, architecture_mock2)
         assert node_names_in_mock1 == ('node2',)
         assert sorted(node_names_in_mock2) == sorted(('node3', 'node4'))
 
-        mocker.patch.object(architecture_mock1, 'node_names', ('node1',))
-        mocker.patch.object(architecture_mock2, 'node_names', ())
+        mocker.patch.object(architecture_mock1, 'node_names_set',
+                            frozenset(('node1',)))
+        mocker.patch.object(architecture_mock2, 'node_names_set',
+                            frozenset(()))
         node_names_in_mock1, node_names_in_mock2 = \
             Architecture.diff_node_names(architecture_mock1, architecture_mock2)
         assert node_names_in_mock1 == ('node1',)
         assert node_names_in_mock2 == ()
 
-        mocker.patch.object(architecture_mock1, 'node_names', ())
-        mocker.patch.object(architecture_mock2, 'node_names', ('node1',))
+        mocker.patch.object(architecture_mock1, 'node_names_set',
+                            frozenset(()))
+        mocker.patch.object(architecture_mock2, 'node_names_set',
+                            frozenset(('node1',)))
         node_names_in_mock1, node_names_in_mock2 = \
             Architecture.diff_node_names(architecture_mock1, architecture_mock2)
         assert node_names_in_mock1 == ()
         assert node_names_in_mock2 == ('node1',)
 
+        assert Architecture.diff_node_names(architecture_mock2, architecture_mock2) == ((), ())
+
     def test_diff_topic_names(self, mocker):
         architecture_mock1 = mocker.Mock(spec=Architecture)
         architecture_mock2 = mocker.Mock(spec=Architecture)
-        mocker.patch.object(architecture_mock1, 'topic_names', ('topic1', 'topic2'))
-        mocker.patch.object(architecture_mock2, 'topic_names', ('topic1', 'topic3', 'topic4'))
+        mocker.patch.object(architecture_mock1, 'topic_names_set',
+                            frozenset(('topic1', 'topic2')))
+        mocker.patch.object(architecture_mock2, 'topic_names_set',
+                            frozenset(('topic1', 'topic3', 'topic4')))
         topics_in_mock1, topics_in_mock2 = \
             Architecture.diff_topic_names(architecture_mock1, architecture_mock2)
         assert topics_in_mock1 == ('topic2',)
         assert sorted(topics_in_mock2) == sorted(('topic3', 'topic4'))
 
-        mocker.patch.object(architecture_mock1, 'topic_names', ('topic1',))
-        mocker.patch.object(architecture_mock2, 'topic_names', ())
+        mocker.patch.object(architecture_mock1, 'topic_names_set',
+                            frozenset(('topic1',)))
+        mocker.patch.object(architecture_mock2, 'topic_names_set',
+                            frozenset(()))
         topics_in_mock1, topics_in_mock2 = \
             Architecture.diff_topic_names(architecture_mock1, architecture_mock2)
         assert topics_in_mock1 == ('topic1',)
         assert topics_in_mock2 == ()
 
-        mocker.patch.object(architecture_mock1, 'topic_names', ())
-        mocker.patch.object(architecture_mock2, 'topic_names', ('topic1',))
+        mocker.patch.object(architecture_mock1, 'topic_names_set',
+                            frozenset(()))
+        mocker.patch.object(architecture_mock2, 'topic_names_set',
+                            frozenset(('topic1',)))
         topics_in_mock1, topics_in_mock2 = \
             Architecture.diff_topic_names(architecture_mock1, architecture_mock2)
         assert topics_in_mock1 == ()
         assert topics_in_mock2 == ('topic1',)
 
+        assert Architecture.diff_topic_names(architecture_mock2, architecture_mock2) == ((), ())
+
+    def test_diff_names_with_architectures(self, mocker):
+        template = TestArchitectureRename.template_architecture_rename
+        mocker.patch('builtins.open', mocker.mock_open(read_data=template.substitute(
+            node='/node_1', executor='executor_1', topic='/topic_1', path='target_path_1',
+            callback_1='/callback_1', callback_2='/callback_2')))
+        arch1 = Architecture('yaml', 'architecture.yaml')
+        mocker.patch('builtins.open', mocker.mock_open(read_data=template.substitute(
+            node='/node_2', executor='executor_1', topic='/topic_2', path='target_path_1',
+            callback_1='/callback_1', callback_2='/callback_2')))
+        arch2 = Architecture('yaml', 'architecture.yaml')
+
+        node_names_in_arch1, node_names_in_arch2 = Architecture.diff_node_names(arch1, arch2)
+        assert node_names_in_arch1 == ('/node_1',)
+        assert node_names_in_arch2 == ('/node_2',)
+        assert set(node_names_in_arch1) == set(arch1.node_names) - set(arch2.node_names)
+        assert set(node_names_in_arch2) == set(arch2.node_names) - set(arch1.node_names)
+
+        topics_in_arch1, topics_in_arch2 = Architecture.diff_topic_names(arch1, arch2)
+        assert topics_in_arch1 == ('/topic_1',)
+        assert topics_in_arch2 == ('/topic_2',)
+        assert set(topics_in_arch1) == set(arch1.topic_names) - set(arch2.topic_names)
+        assert set(topics_in_arch2) == set(arch2.topic_names) - set(arch1.topic_names)
+
+        arch1.rename_node('/node_1', '/node_2')
+        arch1.rename_topic('/topic_1', '/topic_2')
+        assert Architecture.diff_node_names(arch1, arch2) == ((), ())
+        assert Architecture.diff_topic_names(arch1, arch2) == ((), ())
+
     def test_diff_node_pubs(self, mocker):
         node_mock1 = mocker.Mock(spec=NodeStructValue)
         node_mock2 = mocker.Mock(spec=NodeStructValue)
@@ -53,6 +53,12 @@ class TestUtil:
                                   0.4)
         assert '/AAA/BBB/CCC' in str(e.value)
 
+        node_dup = mocker.Mock(spec=Node)
+        mocker.patch.object(node_dup, 'node_name', '/AAA/BBB/CCC')
+        assert Util.find_similar_one('/AAA/BBB/CCC',
+                                     [node, node_dup],
+                                     key) is node
+
     def test_find_similar_one_multi_keys(self, mocker):
         app_mock = mocker.Mock(spec=Application)
         comm_mock = mocker.Mock(spec=Communication)
@@ -164,10 +164,34 @@ class TestArchitectureReaderLttng:
             lttng_mock,
             'get_callback_groups',
             return_value=[cbg])
+        reader = ArchitectureReaderLttng('trace_dir')
 
         callback_groups = reader.get_callback_groups(node_)
         assert callback_groups == [cbg]
 
+    def test_node_values_cached(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        mocker.patch('caret_analyze.infra.lttng.architecture_reader_lttng.Lttng',
+                     return_value=lttng_mock)
+        pub_mock = mocker.Mock(spec=PublisherValue)
+        get_publishers_mock = mocker.patch.object(
+            lttng_mock, 'get_publishers', return_value=[pub_mock])
+        get_timers_mock = mocker.patch.object(lttng_mock, 'get_timers', return_value=[])
+        reader = ArchitectureReaderLttng('trace_dir')
+
+        node = NodeValueWithId('node_name', 'node_id')
+        assert reader.get_publishers(node) == [pub_mock]
+        assert reader.get_publishers(NodeValueWithId('node_name', 'node_id')) == [pub_mock]
+        assert get_publishers_mock.call_count == 1
+
+        # values of the other kinds are fetched together with the first request.
+        assert get_timers_mock.call_count == 1
+        assert reader.get_timers(node) == []
+        assert get_timers_mock.call_count == 1
+
+        reader.get_publishers(NodeValueWithId('node_name', 'other_id'))
+        assert get_publishers_mock.call_count == 2
+
     def test_get_services(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
 